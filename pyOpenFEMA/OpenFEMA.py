@@ -1,18 +1,104 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
+import aiohttp
 import fsspec
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+import io
+import numpy as np
 import pandas as pd
-import geopandas as gpd
-import json
+import pyarrow as pa
+import pyarrow.compute as pc
+import platformdirs
 import yaml
 import warnings
 from pyOpenFEMA.api_url_command_generators import *
-from urllib.error import HTTPError
+from pyOpenFEMA.file_readers import READERS, json_loads
 
 if TYPE_CHECKING:
     from pandas import DataFrame
 
+# The local cache of the OpenFEMA metadata files, which are refreshed daily
+METADATA_CACHE_DIR = platformdirs.user_cache_dir('pyOpenFEMA')
+METADATA_CACHE_EXPIRY = 86400
+
+# Use the C based YAML loader when libyaml is available
+YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Arrow types of the OpenAPI dtypes that are not numpy dtype names
+ARROW_DTYPES = {
+    'string': pa.string(),
+    'boolean': pa.bool_(),
+}
+
+
+def _get_arrow_dtype(dtype: str):
+    """
+    Gets the Arrow backed pandas dtype equivalent to an OpenAPI dtype.
+
+    Parameters
+    ----------
+    dtype : str
+        The OpenAPI dtype (e.g., 'string', 'int32', 'double').
+
+    Returns
+    -------
+    arrow_dtype : pd.ArrowDtype or str
+        The Arrow backed pandas dtype. The input dtype if it has no Arrow equivalent.
+    """
+    if dtype in ARROW_DTYPES:
+        return pd.ArrowDtype(ARROW_DTYPES[dtype])
+    try:
+        return pd.ArrowDtype(pa.from_numpy_dtype(np.dtype(dtype)))
+    except TypeError:
+        return dtype
+
+
+def _to_datetime(series: pd.Series, backend: str, dtype: str = 'date-time') -> pd.Series:
+    """
+    Converts a series of ISO 8601 strings to datetimes, setting unparseable values to NaT.
+
+    Parameters
+    ----------
+    series : Series
+        The series to convert.
+    backend : str
+        The dtype backend of the converted series, 'numpy' or 'arrow'.
+    dtype : str, default 'date-time'
+        The OpenAPI dtype of the series, 'date' or 'date-time'.
+        'date-time' series are converted to UTC.
+
+    Returns
+    -------
+    series : Series
+        The converted series.
+    """
+    utc = dtype == 'date-time'
+
+    # Arrow strings can be cast to timestamps directly with Arrow's vectorized parser.
+    # The cast fails if any value is not a valid timestamp or the zone offset is not
+    # as expected, in which case fall back to pandas.
+    if (backend == 'arrow'
+            and isinstance(series.dtype, pd.ArrowDtype)
+            and (pa.types.is_string(series.dtype.pyarrow_dtype)
+                 or pa.types.is_large_string(series.dtype.pyarrow_dtype))):
+        for tz in (['UTC', None] if utc else [None, 'UTC']):
+            try:
+                timestamps = pc.cast(pa.array(series), pa.timestamp('ns', tz=tz))
+            except pa.ArrowInvalid:
+                continue
+            # Naive date-times are taken to be in UTC, as pandas does with utc=True
+            if utc:
+                timestamps = timestamps.cast(pa.timestamp('ns', tz='UTC'))
+            return pd.Series(timestamps, index=series.index, name=series.name, dtype=pd.ArrowDtype(timestamps.type))
+
+    series = pd.to_datetime(series, format='ISO8601', utc=utc, cache=True, errors='coerce')
+    if backend == 'arrow':
+        tz = None if series.dt.tz is None else str(series.dt.tz)
+        series = series.astype(pd.ArrowDtype(pa.timestamp('ns', tz=tz)))
+    return series
+
 
 class OpenFEMA():
     """
@@ -21,11 +107,17 @@ class OpenFEMA():
     OpenFEMA API documentaion: https://www.fema.gov/about/openfema/api
     """
 
+    # The order of preference of the file formats when reading a dataset.
+    # geojson is first, so geospatial datasets are read as a GeoDataFrame.
+    FILE_FORMAT_PREFERENCE = ('geojson', 'parquet', 'csv', 'jsona')
+
     def __init__(self,
                  openapi_metadata_endpoint: str = "https://www.fema.gov/api/open/metadata/v3.0/OpenApi",
-                 file_format: str = "json"):
+                 file_format: str = "json",
+                 cache: bool = True):
         """
         Initializes the class using the specified OpenAPI metadata endpoint.
+        The metadata is not read from the endpoint until it is first needed.
 
         Parameters
         ----------
@@ -34,9 +126,10 @@ class OpenFEMA():
             This end point contains the meta data of all datasets connected to the API.
         file_format : str, default "json"
             The file format of the endpoint.
+        cache : bool, default True
+            If True, the OpenAPI metadata file and the metadata dataset are cached on disk
+            and only downloaded again once the cache is older than a day.
         """
-        # Create a https file system to read the endpoint metadata file
-        fs = fsspec.filesystem("https")
         valid_formats = ['json', 'yaml']
 
         if file_format not in valid_formats:
@@ -45,30 +138,76 @@ class OpenFEMA():
                 "not available. Acceptable formats are 'json' or 'yaml'"
             )
 
-        # Open the endpoint metadata file
+        # Only store the endpoint. The metadata is read on first use.
+        self.openapi_metadata_endpoint = openapi_metadata_endpoint
+        self.file_format = file_format
+
+        # Create a https file system to read the datasets.
+        # The file system keeps a single HTTP session, so connections are reused across reads.
+        self._fs = fsspec.filesystem("https")
+
+        # The metadata files rarely change, so read them through a local file cache
+        if cache:
+            self._metadata_fs = fsspec.filesystem("filecache",
+                                                  target_protocol="https",
+                                                  cache_storage=METADATA_CACHE_DIR,
+                                                  expiry_time=METADATA_CACHE_EXPIRY)
+        else:
+            self._metadata_fs = self._fs
+
+        # Caches for the per dataset metadata lookups, as the metadata does not
+        # change after it is read
+        self._info_cache: dict[str, dict] = {}
+        self._dtype_cache: dict[tuple[str, int], dict] = {}
+        self._dtype_partitions: dict[tuple[str, int, str], tuple[dict, dict, dict]] = {}
+
+    @cached_property
+    def openapi_metadata(self) -> dict:
+        """
+        The OpenAPI metadata of the OpenFEMA API, read from the endpoint on first access.
+        """
+        openapi_metadata_url = f'{self.openapi_metadata_endpoint}.{self.file_format}'
+
+        # Read the endpoint metadata file as bytes in a single request
         try:
-            openapi_metadata_file = fs.open(f'{openapi_metadata_endpoint}.{file_format}')
+            openapi_metadata_bytes = self._metadata_fs.cat_file(openapi_metadata_url)
         except FileNotFoundError:
             raise FileNotFoundError(
                 'The OpenFEMA OpenAPI metadata endpoint of '
-                f'{openapi_metadata_endpoint}.{file_format} is not valid. Double check '
+                f'{openapi_metadata_url} is not valid. Double check '
                 'the endpoint at https://www.fema.gov/about/openfema/api.'
             )
 
-        # Read the metadata file in as json or yaml
-        if file_format == 'json':
-            self.openapi_metadata = json.loads(openapi_metadata_file.read())
-        elif file_format == 'yaml':
-            self.openapi_metadata = yaml.safe_load(openapi_metadata_file.read())
+        # Parse the metadata file as json or yaml
+        if self.file_format == 'json':
+            return json_loads(openapi_metadata_bytes)
+        elif self.file_format == 'yaml':
+            return yaml.load(openapi_metadata_bytes, Loader=YamlSafeLoader)
 
-        # Extract the URL of the OpenAPI server
-        self.url = [server_dict['url']
-                    for server_dict in self.openapi_metadata['servers']
-                    if server_dict['description'] == 'Production'][0]
+    @cached_property
+    def url(self) -> str:
+        """
+        The URL of the OpenAPI production server.
+        """
+        return [server_dict['url']
+                for server_dict in self.openapi_metadata['servers']
+                if server_dict['description'] == 'Production'][0]
+
+    @cached_property
+    def _schemas(self) -> dict[str, dict]:
+        """
+        The OpenAPI schema of each dataset, keyed by 'v{version}-{dataset}'.
+        """
+        return self.openapi_metadata['components']['schemas']
 
+    @cached_property
+    def df_metadata_dataset(self) -> DataFrame:
+        """
+        The dataset containing the metadata of all datasets, read on first access.
+        """
         # Get the json key for the dataset containing the metadata of all datasets
-        datasets_keys = pd.Series([dataset for dataset in self.openapi_metadata['paths'].keys()])
-        metadata_dataset_key = list(datasets_keys[datasets_keys.str.contains('DataSets')])
+        metadata_dataset_key = [dataset for dataset in self.openapi_metadata['paths'].keys()
+                                if 'DataSets' in dataset]
 
         if len(metadata_dataset_key) != 1:
             raise NotImplementedError('Multiple possible options found for the '
@@ -81,20 +220,66 @@ class OpenFEMA():
         # Read the metadata dataset file as parquet
         # (parquet is a compressed file and should read the fastest)
         try:
-            self.df_metadata_dataset = pd.read_parquet(
-                f'{self.url}{metadata_dataset_key}.parquet'
+            df_metadata_dataset = pd.read_parquet(
+                io.BytesIO(self._metadata_fs.cat_file(f'{self.url}{metadata_dataset_key}.parquet'))
             )
-        except ValueError:
+        except (ValueError, FileNotFoundError):
             raise NotImplementedError('The parquet file containing the metadata for the '
                                       'OpenFEMA API data sets no longer exists. '
                                       'This will require a patch to the OpenFEMA package.')
 
+        return df_metadata_dataset
+
+    @cached_property
+    def _name_to_row(self) -> dict[str, dict]:
+        """
+        The metadata row of each dataset, keyed by dataset name.
+        """
+        self._validate_metadata_dataset_list()
+
+        # Extract each column as a list once, rather than unwrapping every cell
+        # into its own dict with `to_dict(orient='records')`
+        columns = list(self.df_metadata_dataset.columns)
+        column_values = [self.df_metadata_dataset[column].tolist() for column in columns]
+
+        # Keep the first row if a dataset name is duplicated
+        name_to_row = {}
+        for values in zip(*column_values):
+            row = dict(zip(columns, values))
+            name_to_row.setdefault(row['name'], row)
+
+        return name_to_row
+
+    @cached_property
+    def _datasets_sorted(self) -> list[str]:
+        """
+        The sorted names of all non-metadata datasets.
+        """
+        # Drop the two metadata datasets (Datasets and DataSetFields)
+        metadata_datasets_names = [name for name in self._name_to_row if 'DataSet' in name]
+        if len(metadata_datasets_names) > 3:
+            warnings.warn("Non-metadata datasets may have been dropped from the "
+                          "dataset list. Currently dropped metadata datasets: "
+                          f"{metadata_datasets_names}.", UserWarning)
+            dataset_names = list(self._name_to_row)
+        else:
+            dataset_names = [name for name in self._name_to_row if 'DataSet' not in name]
+
+        return sorted(dataset_names)
+
+    @cached_property
+    def _dataset_set(self) -> set[str]:
+        """
+        The set of all non-metadata dataset names.
+        """
+        return set(self._datasets_sorted)
+
     def _validate_metadata_dataset_list(self):
         """
         Validates the metadata dataset has the individual dataset names.
         """
         # Check if he metadata dataset has the column name (which contains the datasets)
-        if ~(self.df_metadata_dataset.columns.str.contains('name').any()):
+        if 'name' not in self.df_metadata_dataset.columns:
             raise NotImplementedError('The column indicating the names of the datasets in '
                                       'the metadata for the OpenFEMA API data sets has changed. '
                                       'This will require a patch to the OpenFEMA package.')
@@ -108,10 +293,8 @@ class OpenFEMA():
         dataset : str
             The name of the dataset to validate for existence.
         """
-        self._validate_metadata_dataset_list()
-
         # Confirm the dataset is in the list of datasets
-        if pd.Series(self.list_datasets()).isin([dataset]).sum() != 1:
+        if dataset not in self._dataset_set:
             raise ValueError(
                 f'The specified dataset of {dataset} was not found in the dataset list. '
                 'Please ensure the dataset selected is correct.'
@@ -126,23 +309,8 @@ class OpenFEMA():
         dataset_names : list[str]
             A list of all datasets available on OpenFEMA.
         """
-        self._validate_metadata_dataset_list()
-
-        # Get the dataset names from the metadata dataset
-        dataset_names = self.df_metadata_dataset['name'].drop_duplicates()
-
-        # Drop the two metadata datasets (Datasets and DataSetFields)
-        metadata_datasets = dataset_names.str.contains('DataSet')
-        if metadata_datasets.sum() > 3:
-            metadata_datasets_names = list(dataset_names[metadata_datasets])
-            warnings.warn("Non-metadata datasets may have been dropped from the "
-                          "dataset list. Currently dropped metadata datasets: "
-                          f"{metadata_datasets_names}.", UserWarning)
-        else:
-            dataset_names = dataset_names[~metadata_datasets]
-
-        # Return the list of datasets
-        return list(dataset_names.sort_values())
+        # The dataset list is built once on initialization
+        return list(self._datasets_sorted)
 
     def dataset_info(self, dataset: str) -> dict:
         """
@@ -158,22 +326,55 @@ class OpenFEMA():
         dataset_dict : dict
             A dictionary containing a variety of metadata info on the specified dataset.
         """
-        self._validate_metadata_dataset_list()
+        # Return the cached metadata if this dataset has already been looked up
+        if dataset in self._info_cache:
+            return self._copy_dataset_info(self._info_cache[dataset])
 
         self._check_if_dataset_exists(dataset)
 
-        # Get the dataset names from the metadata dataset
-        dataset_names = self.df_metadata_dataset['name']
-
         # Get the dataset metadata row from the metadata dataset
-        # and convert to a dictionary
-        dataset_dict = self.df_metadata_dataset[dataset_names == dataset].to_dict(orient='records')[0]
+        dataset_dict = dict(self._name_to_row[dataset])
 
         # This metadata dictionary doesn't contain the columns. Let's add that.
         column_dtypes = self._get_dataset_dtype(dataset, version=dataset_dict['version'])
         dataset_dict['columns'] = column_dtypes
 
-        return dataset_dict
+        # Decode the file formats from the distribution json strings once
+        dataset_dict['formats'] = {json_loads(format_str)['format']
+                                   for format_str in dataset_dict['distribution']}
+
+        self._info_cache[dataset] = dataset_dict
+
+        return self._copy_dataset_info(dataset_dict)
+
+    @staticmethod
+    def _copy_dataset_info(dataset_dict: dict) -> dict:
+        """
+        Copies a cached dataset metadata dictionary, including its columns and formats,
+        so changes by the caller do not alter the cache.
+        """
+        return {**dataset_dict,
+                'columns': dict(dataset_dict['columns']),
+                'formats': set(dataset_dict['formats'])}
+
+    def dataset_infos(self, datasets: list[str]) -> dict[str, dict]:
+        """
+        Returns the metadata info on each of the specified datasets.
+
+        Parameters
+        ----------
+        datasets : list[str]
+            The names of the datasets to get metadata for.
+
+        Returns
+        -------
+        dataset_dicts : dict[str, dict]
+            A dictionary with the dataset names as the keys and the metadata dictionary
+            of each dataset (see `dataset_info`) as the values.
+            Duplicate dataset names are only looked up once.
+        """
+        # Once the metadata is read, each lookup is an in-memory dictionary lookup
+        return {dataset: self.dataset_info(dataset) for dataset in dict.fromkeys(datasets)}
 
     def generate_url(self,
                      dataset: str,
@@ -225,11 +426,10 @@ class OpenFEMA():
         url : str
             The URL of the dataset subset.
         """
-        # Get the API URL
-        web_service_url = self.dataset_info(dataset)['webService']
-
-        # Get the columns and dtypes of the dataset
-        column_dtypes = self._get_dataset_dtype(dataset, version=self.dataset_info(dataset)['version'])
+        # Get the API URL and the columns and dtypes of the dataset
+        dataset_dict = self.dataset_info(dataset)
+        web_service_url = dataset_dict['webService']
+        column_dtypes = dataset_dict['columns']
 
         # Generate any command substrings
         select_url_substring = generate_column_select_command(columns, column_dtypes)
@@ -268,6 +468,7 @@ class OpenFEMA():
                      top: int | None = None,
                      skip: int | None = None,
                      file_format: str = None,
+                     backend: Literal['numpy', 'arrow'] = 'arrow',
                      ) -> DataFrame:
         """
         Reads the specified dataset into a dataframe.
@@ -304,29 +505,56 @@ class OpenFEMA():
             Setting this keyword is useful if the automatic file format selector does not include all file formats.
             For example, not all geospatial datasets will have the geojson file format automatically detected.
             So, specifying it will allow for the dataset to be read as a GeoDataFrame.
+        backend : str, default 'arrow'
+            The backend of the dataframe dtypes, 'arrow' or 'numpy'.
+            The 'arrow' backend stores the columns in Arrow arrays (`pd.ArrowDtype`), which
+            uses much less memory for string columns than the 'numpy' backend.
 
         Returns
         -------
         df_dataset : DataFrame
             The dataframe containing the dataset.
         """
+        valid_backends = ['numpy', 'arrow']
+        if backend not in valid_backends:
+            raise ValueError(
+                f"The specified backend of '{backend}' is not available. "
+                "Acceptable backends are 'numpy' or 'arrow'"
+            )
+
+        # Look up the dataset metadata once and reuse it below
+        dataset_dict = self.dataset_info(dataset)
+
         # Get the possible file formats from the metadata dataset
-        supported_file_formats = [
-            json.loads(format_str)['format']
-            for format_str in self.dataset_info(dataset)['distribution']
-        ]
+        supported_file_formats = dataset_dict['formats']
 
         # Get the columns and dtypes of the dataset
-        column_dtypes = self._get_dataset_dtype(dataset, version=self.dataset_info(dataset)['version'])
-
-        # If a file format is not specified, automatically select the file format in a preferential
-        # order of geojson (if the dataset is geospatial), parquet, csv, then jsona
-        preferential_file_formats = ['geojson', 'parquet', 'csv', 'jsona']
+        column_dtypes = dataset_dict['columns']
+        # Limit to the requested columns, keeping the requested column order
+        if columns:
+            column_dtypes = {column: column_dtypes[column] for column in columns if column in column_dtypes}
+
+        # Push the column selection and dtypes into the file readers where possible.
+        # Datetimes are not parsed on read, as columns can be missing from the file.
+        dtype_partitions = self._get_dataset_dtype_partitions(dataset, version=dataset_dict['version'],
+                                                              backend=backend)
+        _, int_columns, other_columns = dtype_partitions
+        non_datetime_dtypes = {column: dtype
+                               for partition in (int_columns, other_columns)
+                               for column, dtype in partition.items()
+                               if column in column_dtypes}
+
+        # If a file format is not specified, automatically select the file format in the
+        # preferential order of FILE_FORMAT_PREFERENCE
         supported_preferential_file_formats = [
             preferred_file_format
-            for preferred_file_format in preferential_file_formats
+            for preferred_file_format in self.FILE_FORMAT_PREFERENCE
             if preferred_file_format in supported_file_formats
         ]
+        if not supported_preferential_file_formats:
+            raise ValueError(f"None of the file formats of the {dataset} dataset "
+                             f"({sorted(supported_file_formats)}) are supported. "
+                             f"Supported file formats are {list(self.FILE_FORMAT_PREFERENCE)}.")
         # If specified, use that file format as first choice
         if file_format is not None:
             if file_format not in supported_preferential_file_formats:
@@ -344,30 +572,58 @@ class OpenFEMA():
             file_url = self.generate_url(dataset, columns, filters, sort_by, top, skip, file_format)
 
             try:
-                if file_format == 'geojson':
-                    df_dataset = gpd.read_file(file_url, engine='pyogrio', use_arrow=True)
-                elif file_format == 'parquet':
-                    df_dataset = pd.read_parquet(file_url)
-                elif file_format == 'csv':
-                    df_dataset = pd.read_csv(file_url)
-                elif file_format == 'jsona':
-                    df_dataset = pd.read_json(file_url)
+                # Stream the file to the reader of the file format, rather than
+                # buffering the whole download in memory first
+                with self._fs.open(file_url, 'rb', block_size=0) as file:
+                    df_dataset = READERS[file_format](file, columns, non_datetime_dtypes, backend)
 
                 break
-            except HTTPError:
+            except (FileNotFoundError, aiohttp.ClientResponseError):
                 continue
+        else:
+            raise FileNotFoundError(f'The {dataset} dataset could not be read in any of the file formats '
+                                    f'{supported_preferential_file_formats}.')
 
         # Enforce the dtype of each column
-        # Limit to the requested columns
-        if columns:
-            column_dtypes = {column: dtype for column, dtype in column_dtypes.items() if column in columns}
         # Limit columns to those that exist in dataset.
         # Top can drop columns if all "top" returned rows are empty for a given column
         column_dtypes = {column: dtype for column, dtype in column_dtypes.items() if column in df_dataset.columns}
-        df_dataset = self._set_dataset_dtype(df_dataset, column_dtypes)
+        df_dataset = self._set_dataset_dtype(df_dataset, column_dtypes, dtype_partitions, backend)
 
         return df_dataset
 
+    def read_datasets(self, datasets: list[str], **kwargs) -> dict[str, DataFrame]:
+        """
+        Reads the specified datasets into dataframes concurrently.
+
+        Parameters
+        ----------
+        datasets : list[str]
+            The names of the datasets to read.
+        **kwargs
+            Keyword arguments passed to `read_dataset` for every dataset
+            (e.g., `columns`, `filters`, `top`, `backend`).
+
+        Returns
+        -------
+        df_datasets : dict[str, DataFrame]
+            A dictionary with the dataset names as the keys and the dataframe
+            containing each dataset as the values.
+            Duplicate dataset names are only read once.
+        """
+        datasets = list(dict.fromkeys(datasets))
+
+        # Read the metadata before starting the threads, so they do not all download it at once.
+        # cached_property does not lock its first computation on Python 3.12 and newer.
+        self._dataset_set
+        self._schemas
+
+        # The reads are bound by the network, which releases the GIL, so threads read in parallel
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(datasets)))) as executor:
+            futures = [executor.submit(self.read_dataset, dataset, **kwargs) for dataset in datasets]
+
+            return {dataset: future.result() for dataset, future in zip(datasets, futures)}
+
     def _get_dataset_dtype(self, dataset: str, version: int) -> dict:
         """
         Gets the dtype of each column in the given dataset.
@@ -384,37 +640,90 @@ class OpenFEMA():
         column_dtypes : dict
             A dictionary containing the column names as the keys and dtype as the values.
         """
+        # Return the cached dtypes if this dataset version has already been looked up
+        if (dataset, version) in self._dtype_cache:
+            return self._dtype_cache[(dataset, version)]
+
         # Get the dataset with version number
         dataset_w_version = f"v{version}-{dataset}"
 
         # The column dtypes are in the OpenAPI metadata.
-        # First, get the dataset name in the OpenAPI metadata
-        openapi_dataset_metadata = self.openapi_metadata['components']['schemas']
-        dataset_names = list(openapi_dataset_metadata.keys())
-        dataset_openapi_name = [dataset_name for dataset_name in dataset_names if dataset_w_version == dataset_name]
+        # First, get the dataset schema in the OpenAPI metadata
+        dataset_schema = self._schemas.get(dataset_w_version)
 
-        # Confirm this is the only dataset with the OpenAPI metadata name
-        if len(dataset_openapi_name) == 0:
+        # Confirm the dataset exists in the OpenAPI metadata
+        if dataset_schema is None:
             raise NotImplementedError(f'Version {version} of the {dataset} dataset not found '
                                       'in the OpenFEMA API metadata. '
                                       f'Double check this version of the dataset exists.')
-        elif len(dataset_openapi_name) != 1:
-            raise NotImplementedError('Multiple possible options found for the '
-                                      'dataset in the OpenFEMA API metadata. '
-                                      f'Current options are {dataset_openapi_name}. This '
-                                      'will require a patch to the OpenFEMA package.')
-        else:
-            dataset_openapi_name = dataset_openapi_name[0]
 
         # Extract the columns dtype metadata
-        column_metadata = openapi_dataset_metadata[dataset_openapi_name]['properties']
+        column_metadata = dataset_schema['properties']
         column_dtypes = {key: value['format'] for key, value in column_metadata.items()}
 
+        self._dtype_cache[(dataset, version)] = column_dtypes
+
+        # Partition the columns by dtype category once, so reading the dataset
+        # does not need to recheck each dtype
+        datetime_columns = {}
+        int_columns = {}
+        other_columns = {}
+        for column, dtype in column_dtypes.items():
+            if 'date' in dtype:
+                datetime_columns[column] = dtype
+            # Allow for ints to accomodate NaNs. This is allowed
+            # in pandas if we use Int vs int
+            elif 'int' in dtype:
+                int_columns[column] = dtype.capitalize()
+            else:
+                other_columns[column] = dtype
+        self._dtype_partitions[(dataset, version, 'numpy')] = (datetime_columns, int_columns, other_columns)
+
         return column_dtypes
 
+    def _get_dataset_dtype_partitions(self,
+                                      dataset: str,
+                                      version: int,
+                                      backend: Literal['numpy', 'arrow'] = 'numpy',
+                                      ) -> tuple[dict, dict, dict]:
+        """
+        Gets the columns of the given dataset partitioned by dtype category.
+
+        Parameters
+        ----------
+        dataset : str
+            The name of the dataset to get its columns' dtype partitions.
+        version : int
+            The version of the dataset.
+        backend : str, default 'numpy'
+            The backend of the pandas dtypes, 'numpy' or 'arrow'.
+
+        Returns
+        -------
+        dtype_partitions : tuple[dict, dict, dict]
+            A dictionary of the date or date-time columns and their dtype, a dictionary of the
+            integer columns and their nullable pandas dtype, and a dictionary of all other
+            columns and their dtype.
+        """
+        if (dataset, version, 'numpy') not in self._dtype_partitions:
+            self._get_dataset_dtype(dataset, version)
+
+        # Map the numpy partitions to Arrow dtypes the first time they are requested
+        if (dataset, version, backend) not in self._dtype_partitions:
+            datetime_columns, int_columns, other_columns = self._dtype_partitions[(dataset, version, 'numpy')]
+            self._dtype_partitions[(dataset, version, backend)] = (
+                datetime_columns,
+                {column: _get_arrow_dtype(dtype.lower()) for column, dtype in int_columns.items()},
+                {column: _get_arrow_dtype(dtype) for column, dtype in other_columns.items()},
+            )
+
+        return self._dtype_partitions[(dataset, version, backend)]
+
     def _set_dataset_dtype(self,
                            df_dataset: DataFrame,
                            column_dtypes: dict,
+                           dtype_partitions: tuple[dict, dict, dict],
+                           backend: Literal['numpy', 'arrow'] = 'numpy',
                            ) -> DataFrame:
         """
         Gets the dtype of each column in the given dataset.
@@ -425,27 +734,29 @@ class OpenFEMA():
             The dataframe containing the dataset.
         column_dtypes : dict
             A dictionary containing the column names as the keys and dtype as the values.
+            Only these columns have their dtype set.
+        dtype_partitions : tuple[dict, dict, dict]
+            The dtype partitions of the dataset from `_get_dataset_dtype_partitions`.
+        backend : str, default 'numpy'
+            The backend of the datetime dtypes, 'numpy' or 'arrow'.
 
         Returns
         -------
         df_dataset : DataFrame
             The dataframe containing the dataset with its dtypes set.
         """
-        # Convert dtypes of date or date-time to datetimes
-        non_datetime_columns = {}
-        datetime_columns = []
-        for column, dtype in column_dtypes.items():
-            if 'date' in dtype:
-                datetime_columns.append(column)
-            # Allow for ints to accomodate NaNs. This is allowed
-            # in pandas if we use Int vs int
-            elif 'int' in dtype:
-                non_datetime_columns[column] = dtype.capitalize()
-            else:
-                non_datetime_columns[column] = dtype
+        # Limit the precomputed dtype partitions to the columns to set
+        datetime_columns, int_columns, other_columns = dtype_partitions
+        non_datetime_columns = {column: dtype
+                                for partition in (int_columns, other_columns)
+                                for column, dtype in partition.items()
+                                if column in column_dtypes}
+        datetime_columns = {column: dtype for column, dtype in datetime_columns.items() if column in column_dtypes}
 
         df_dataset = df_dataset.astype(non_datetime_columns)
-        for datetime_column in datetime_columns:
-            df_dataset[datetime_column] = pd.to_datetime(df_dataset[datetime_column], errors='coerce')
+        # Convert each datetime column, then assign them all back at once
+        if datetime_columns:
+            df_dataset = df_dataset.assign(**{column: _to_datetime(df_dataset[column], backend, dtype)
+                                              for column, dtype in datetime_columns.items()})
 
         return df_dataset
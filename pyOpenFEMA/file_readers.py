@@ -0,0 +1,217 @@
+"""
+Readers for each file format of the OpenFEMA API.
+
+Each reader takes the file as a binary file object opened from a shared
+HTTP session, rather than each reader opening its own connection. Readers
+parse the file as it is streamed where they can, and only read it fully
+into memory where they need random access. Every reader has the same
+signature:
+
+    reader(file, columns, dtypes, backend) -> DataFrame
+
+where `columns` is in the syntax of `OpenFEMA.read_dataset`, `dtypes` are
+the pandas dtypes of the non-datetime columns, and `backend` is 'numpy' or
+'arrow'. The API has already applied the column selection and filters in
+the URL. So, readers only use the columns to skip unneeded data and do not
+filter the returned rows again.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, BinaryIO, Literal
+
+import json
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyogrio
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+def json_loads(data: bytes | str):
+    """
+    Parses json, using orjson when it is available.
+
+    Parameters
+    ----------
+    data : bytes or str
+        The json to parse.
+
+    Returns
+    -------
+    obj
+        The parsed json object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_geojson(file: BinaryIO,
+                 columns: list[str] | None = None,
+                 dtypes: dict | None = None,
+                 backend: Literal['numpy', 'arrow'] = 'arrow',
+                 ) -> DataFrame:
+    """
+    Reads a geojson file into a GeoDataFrame with the column selection pushed into the reader.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        The geojson file.
+    columns : list[str], default None
+        A list of the columns to read.
+        Defaults to None, meaning all columns are read.
+    dtypes : dict, default None
+        The dtypes of the columns. Not used by this reader.
+    backend : str, default 'arrow'
+        The backend of the dataframe dtypes, 'arrow' or 'numpy'. Not used by this reader.
+
+    Returns
+    -------
+    df_dataset : GeoDataFrame
+        The dataframe containing the geojson file.
+    """
+    # OGR opens the file from memory, so read the stream into a single buffer.
+    # Passing the file object would make pyogrio rewind it, which a stream cannot do.
+    return pyogrio.read_dataframe(file.read(), columns=columns, use_arrow=True)
+
+
+def read_parquet(file: BinaryIO,
+                 columns: list[str] | None = None,
+                 dtypes: dict | None = None,
+                 backend: Literal['numpy', 'arrow'] = 'arrow',
+                 ) -> DataFrame:
+    """
+    Reads a parquet file with the column selection pushed into the reader.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        The parquet file.
+    columns : list[str], default None
+        A list of the columns to read.
+        Defaults to None, meaning all columns are read.
+    dtypes : dict, default None
+        The dtypes of the columns. Not used by this reader, as parquet files are typed.
+    backend : str, default 'arrow'
+        The backend of the dataframe dtypes, 'arrow' or 'numpy'.
+
+    Returns
+    -------
+    df_dataset : DataFrame
+        The dataframe containing the parquet file.
+    """
+    # Parquet needs random access to the file footer, so read the whole file into memory
+    parquet_file = pa.BufferReader(file.read())
+
+    # Limit columns to those that exist in the file.
+    # Top can drop columns if all "top" returned rows are empty for a given column
+    if columns:
+        file_columns = pq.read_schema(parquet_file).names
+        columns = [column for column in columns if column in file_columns]
+
+    table = pq.read_table(parquet_file, columns=columns)
+
+    if backend == 'arrow':
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
+
+
+def read_csv(file: BinaryIO,
+             columns: list[str] | None = None,
+             dtypes: dict | None = None,
+             backend: Literal['numpy', 'arrow'] = 'arrow',
+             ) -> DataFrame:
+    """
+    Reads a csv file with the column selection and dtypes pushed into the reader.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        The csv file, which is parsed as it is streamed.
+    columns : list[str], default None
+        A list of the columns to read.
+        Defaults to None, meaning all columns are read.
+    dtypes : dict, default None
+        The dtypes of the columns.
+    backend : str, default 'arrow'
+        The backend of the dataframe dtypes, 'arrow' or 'numpy'.
+
+    Returns
+    -------
+    df_dataset : DataFrame
+        The dataframe containing the csv file.
+    """
+    if backend == 'arrow':
+        # The pyarrow engine only accepts a list of columns, which cannot
+        # be missing from the file. So, rely on the API column selection.
+        return pd.read_csv(file, dtype=dtypes, engine='pyarrow', dtype_backend='pyarrow')
+
+    usecols = None if not columns else (lambda column: column in columns)
+    return pd.read_csv(file, dtype=dtypes, usecols=usecols)
+
+
+def read_jsona(file: BinaryIO,
+               columns: list[str] | None = None,
+               dtypes: dict | None = None,
+               backend: Literal['numpy', 'arrow'] = 'arrow',
+               ) -> DataFrame:
+    """
+    Reads a json array file into a dataframe by converting the records to Arrow in one pass.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        The json array file.
+    columns : list[str], default None
+        A list of the columns to read. Not used by this reader.
+    dtypes : dict, default None
+        The dtypes of the columns. Columns are cast to their Arrow dtype where the values allow it.
+    backend : str, default 'arrow'
+        The backend of the dataframe dtypes, 'arrow' or 'numpy'.
+
+    Returns
+    -------
+    df_dataset : DataFrame
+        The dataframe containing the json array file.
+    """
+    records = json_loads(file.read())
+    if not records:
+        return pd.DataFrame()
+
+    try:
+        # Arrow infers the columns from all records, as records can omit null values
+        table = pa.Table.from_struct_array(pa.array(records))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # A column mixes json types (e.g., numbers and strings), so read it as an object column
+        return pd.DataFrame.from_records(records)
+
+    arrow_types = {column: dtype.pyarrow_dtype
+                   for column, dtype in (dtypes or {}).items()
+                   if isinstance(dtype, pd.ArrowDtype)}
+    for i_column, column in enumerate(table.column_names):
+        if column in arrow_types:
+            try:
+                table = table.set_column(i_column, column, table.column(i_column).cast(arrow_types[column]))
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                # The values do not match the dtype, so keep the inferred type
+                continue
+
+    if backend == 'arrow':
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
+
+
+# The reader of each supported file format
+READERS = {
+    'geojson': read_geojson,
+    'parquet': read_parquet,
+    'csv': read_csv,
+    'jsona': read_jsona,
+}
@@ -1,12 +1,71 @@
+import pandas as pd
+import pyarrow as pa
 import pytest
 from pandas import DataFrame
 
 from pyOpenFEMA import OpenFEMA
+from pyOpenFEMA.OpenFEMA import _to_datetime
 
 # Initialize an OpenFEMA object for reuse and faster testing
 openfema = OpenFEMA()
 
 
+@pytest.mark.parametrize('backend', ['numpy', 'arrow'])
+@pytest.mark.parametrize('values, dtype, tz, expected', [
+    (['2020-01-02T03:04:05.000Z', None], 'date-time', 'UTC', ['2020-01-02 03:04:05', None]),
+    (['2020-01-02T03:04:05', None], 'date-time', 'UTC', ['2020-01-02 03:04:05', None]),
+    (['2020-01-02T03:04:05-05:00'], 'date-time', 'UTC', ['2020-01-02 08:04:05']),
+    (['2020-01-02', None], 'date', None, ['2020-01-02', None]),
+    (['2020-01-02T03:04:05', None], 'date', None, ['2020-01-02 03:04:05', None]),
+    (['01/02/2020', '2020-01-02'], 'date-time', 'UTC', [None, '2020-01-02']),
+    (['01/02/2020', '2020-01-02'], 'date', None, [None, '2020-01-02']),
+])
+def test_to_datetime(backend, values, dtype, tz, expected):
+    if backend == 'arrow':
+        series = pd.Series(values, dtype=pd.ArrowDtype(pa.string()))
+    else:
+        series = pd.Series(values, dtype=object)
+    series = _to_datetime(series, backend, dtype)
+
+    if backend == 'arrow':
+        assert isinstance(series.dtype, pd.ArrowDtype)
+        assert pa.types.is_timestamp(series.dtype.pyarrow_dtype)
+    else:
+        assert pd.api.types.is_datetime64_any_dtype(series.dtype)
+    assert str(series.dt.tz) == str(tz)
+    # Values that are not ISO 8601 are set to NaT
+    expected = pd.to_datetime(pd.Series(expected), utc=tz is not None)
+    assert series.isna().tolist() == expected.isna().tolist()
+    assert series.dropna().astype(expected.dtype).tolist() == expected.dropna().tolist()
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'arrow'])
+@pytest.mark.parametrize('n_rows', [0, 2])
+def test_set_dataset_dtype(backend, n_rows):
+    column_dtypes = {'test1': 'date-time', 'test2': 'date', 'test3': 'int32'}
+    if backend == 'arrow':
+        string_dtype = pd.ArrowDtype(pa.string())
+        dtype_partitions = ({'test1': 'date-time', 'test2': 'date'}, {'test3': pd.ArrowDtype(pa.int32())}, {})
+    else:
+        string_dtype = object
+        dtype_partitions = ({'test1': 'date-time', 'test2': 'date'}, {'test3': 'Int32'}, {})
+    df = DataFrame({
+        'test1': pd.Series(['2020-01-02T03:04:05.000Z'] * n_rows, dtype=string_dtype),
+        'test2': pd.Series(['2020-01-02'] * n_rows, dtype=string_dtype),
+        'test3': pd.Series([1] * n_rows, dtype='int64'),
+    })
+    df = openfema._set_dataset_dtype(df, column_dtypes, dtype_partitions, backend)
+
+    # Datetime columns are converted even when no rows are returned
+    assert len(df) == n_rows
+    assert str(df['test1'].dt.tz) == 'UTC'
+    assert df['test2'].dt.tz is None
+    if backend == 'arrow':
+        assert df['test3'].dtype == pd.ArrowDtype(pa.int32())
+    else:
+        assert df['test3'].dtype == 'Int32'
+
+
 def test_list_datasets():
     datasets = openfema.list_datasets()
 
@@ -23,6 +82,27 @@ def test_dataset_info(dataset):
     assert 'columns' in info_dict.keys()
     assert 'distribution' in info_dict.keys()
     assert 'webService' in info_dict.keys()
+    assert 'formats' in info_dict.keys()
+
+
+def test_dataset_info_is_copy():
+    dataset = openfema.list_datasets()[0]
+    info_dict = openfema.dataset_info(dataset)
+    info_dict['columns'].clear()
+    info_dict['formats'].clear()
+
+    info_dict = openfema.dataset_info(dataset)
+    assert len(info_dict['columns']) > 0
+    assert len(info_dict['formats']) > 0
+
+
+def test_dataset_infos():
+    datasets = openfema.list_datasets()[:3]
+    info_dicts = openfema.dataset_infos(datasets)
+
+    assert list(info_dicts.keys()) == datasets
+    for dataset, info_dict in info_dicts.items():
+        assert info_dict['name'] == dataset
 
 
 @pytest.mark.parametrize('dataset, columns, filters, sort_by, top, skip',
@@ -41,3 +121,13 @@ def test_read_dataset(dataset, columns, filters, sort_by, top, skip):
         assert list(df.columns) == columns
     if top is not None:
         assert len(df) == top
+
+
+def test_read_datasets():
+    datasets = ['FemaRegions', 'DeclarationDenials']
+    dfs = openfema.read_datasets(datasets, top=5)
+
+    assert list(dfs.keys()) == datasets
+    for df in dfs.values():
+        assert isinstance(df, DataFrame)
+        assert len(df) == 5
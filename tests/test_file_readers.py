@@ -0,0 +1,86 @@
+import io
+
+import geopandas as gpd
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pyOpenFEMA.file_readers import *
+
+
+@pytest.fixture
+def df_test():
+    df_test = pd.DataFrame({
+        'test1': [1, 2, 3, 4],
+        'test2': [0.5, 1.5, 2.5, 3.5],
+        'test3': ['a', 'b', 'c', 'd'],
+    })
+
+    return df_test
+
+
+def to_file(df, file_format):
+    file = io.BytesIO()
+    if file_format == 'parquet':
+        df.to_parquet(file)
+    elif file_format == 'csv':
+        df.to_csv(file, index=False)
+    elif file_format == 'jsona':
+        file.write(df.to_json(orient='records').encode())
+    file.seek(0)
+
+    return file
+
+
+@pytest.mark.parametrize('file_format', ['parquet', 'csv', 'jsona'])
+@pytest.mark.parametrize('backend', ['numpy', 'arrow'])
+def test_readers(file_format, backend, df_test):
+    df = READERS[file_format](to_file(df_test, file_format), backend=backend)
+
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == list(df_test.columns)
+    assert len(df) == len(df_test)
+    if backend == 'arrow':
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+@pytest.mark.parametrize('columns', [None, ['test1', 'test3'], ['test1', 'missing']])
+def test_read_parquet(columns, df_test):
+    df = read_parquet(to_file(df_test, 'parquet'), columns)
+
+    if columns is not None:
+        assert list(df.columns) == [column for column in columns if column in df_test.columns]
+    assert len(df) == len(df_test)
+
+
+def test_read_jsona_missing_keys():
+    file = io.BytesIO(b'[{"test1": 1, "test3": "a"}, {"test1": 2, "test2": 0.5}]')
+    dtypes = {'test1': pd.ArrowDtype(pa.int32()), 'test3': pd.ArrowDtype(pa.int64())}
+    df = read_jsona(file, dtypes=dtypes)
+
+    assert list(df.columns) == ['test1', 'test3', 'test2']
+    assert df['test1'].dtype == pd.ArrowDtype(pa.int32())
+    assert df['test3'].isna().sum() == 1
+    assert df['test2'].isna().sum() == 1
+
+
+@pytest.mark.parametrize('columns', [None, ['test1'], ['test1', 'test3']])
+def test_read_geojson(columns, df_test):
+    gdf_test = gpd.GeoDataFrame(df_test, geometry=gpd.points_from_xy(df_test['test1'], df_test['test2']))
+    file = io.BytesIO(gdf_test.to_json().encode())
+    df = read_geojson(file, columns)
+
+    assert isinstance(df, gpd.GeoDataFrame)
+    if columns is not None:
+        assert list(df.columns) == columns + ['geometry']
+    assert len(df) == len(df_test)
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'arrow'])
+def test_read_jsona_mixed_types(backend):
+    file = io.BytesIO(b'[{"test1": 1, "test2": 0.5}, {"test1": "a"}]')
+    df = read_jsona(file, backend=backend)
+
+    assert list(df.columns) == ['test1', 'test2']
+    assert df['test1'].tolist() == [1, 'a']
+    assert df['test2'].isna().sum() == 1